@@ -10,12 +10,14 @@ if __name__ == "__main__":
     if "--demo" in sys.argv:
         SimulationApp().demo()
     else:
+        from refrigeration.gui import run_gui
+
         try:
-            from refrigeration.gui import run_gui
+            exit_code = run_gui()
         except ModuleNotFoundError as exc:
             if exc.name == "PyQt6":
                 print("PyQt6 is required for GUI mode. Install it with: pip install PyQt6")
                 raise SystemExit(1)
             raise
 
-        raise SystemExit(run_gui())
+        raise SystemExit(exit_code)
@@ -3,8 +3,26 @@
 from dataclasses import dataclass
 
 
-@dataclass
-class WalkInDimensionsFt:
+class Versioned:
+    """Counts attribute writes so consumers can cheaply detect stale output.
+
+    Every assignment bumps the version, even when the new value compares equal
+    to the old one, so writers should skip no-op assignments themselves.
+    """
+
+    __slots__ = ("_version",)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        object.__setattr__(self, name, value)
+        object.__setattr__(self, "_version", getattr(self, "_version", 0) + 1)
+
+    @property
+    def version(self) -> int:
+        return getattr(self, "_version", 0)
+
+
+@dataclass(slots=True)
+class WalkInDimensionsFt(Versioned):
     length: float = 10.0
     width: float = 10.0
     height: float = 10.0
@@ -14,8 +32,8 @@ class WalkInDimensionsFt:
         return self.length * self.width * self.height
 
 
-@dataclass
-class ControlConfig:
+@dataclass(slots=True)
+class ControlConfig(Versioned):
     target_temp_c: float = 2.0
     hysteresis_c: float = 1.0
     compressor_min_off_s: int = 120
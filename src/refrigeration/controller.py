@@ -4,20 +4,32 @@ from __future__ import annotations
 
 import json
 import time
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, fields
+from typing import Callable, get_type_hints
 
-from .config import ControlConfig, WalkInDimensionsFt
+from .config import ControlConfig, Versioned, WalkInDimensionsFt
 from .uart import UARTTransport
 
+_SENSOR_KEYS: frozenset[str] = frozenset({"air_temp_c"})
+_INPUT_KEYS: frozenset[str] = frozenset({"door_open", "power_ok"})
 
-@dataclass
-class IOState:
+
+@dataclass(slots=True)
+class IOState(Versioned):
     air_temp_c: float = 8.0
     door_open: bool = False
     power_ok: bool = True
     compressor_on: bool = False
 
 
+def _field_names(obj: object) -> tuple[str, ...]:
+    return tuple(f.name for f in fields(obj))
+
+
+def _snapshot(obj: object, names: tuple[str, ...]) -> dict:
+    return {name: getattr(obj, name) for name in names}
+
+
 class RefrigerationController:
     def __init__(
         self,
@@ -31,12 +43,26 @@ class RefrigerationController:
         self.config = config or ControlConfig()
         self.dimensions = dimensions or WalkInDimensionsFt()
         self.io = IOState()
-        self.last_compressor_off_s = time.time()
+        self.last_compressor_off_s = time.monotonic()
+
+        # Field names are fixed per dataclass; resolve them once instead of
+        # deep-copying through asdict() on every status publish.
+        self._config_fields = _field_names(self.config)
+        self._dimension_fields = _field_names(self.dimensions)
+        self._io_fields = _field_names(self.io)
+        # get_type_hints resolves string annotations, so this keeps working if
+        # config.py adopts ``from __future__ import annotations``.
+        config_types = get_type_hints(type(self.config))
+        self._config_converters: dict[str, Callable[[str], object]] = {
+            f.name: config_types[f.name] for f in fields(self.config)
+        }
+        self._last_status_token: tuple[int, int, int] | None = None
 
     def step(self) -> None:
+        now = time.monotonic()
         self._process_monitor_uart()
         self._process_io_uart()
-        self._run_control_logic()
+        self._run_control_logic(now)
         self._publish_status()
 
     def _process_monitor_uart(self) -> None:
@@ -44,61 +70,99 @@ class RefrigerationController:
         if not line:
             return
 
-        if line.startswith("SET ") and "=" in line:
-            _, payload = line.split(" ", 1)
-            key, raw_value = payload.split("=", 1)
-            if hasattr(self.config, key):
-                current = getattr(self.config, key)
-                typed_value = type(current)(raw_value)
-                setattr(self.config, key, typed_value)
-                self.monitor_uart.write_line(f"ACK {key}={typed_value}")
-            else:
-                self.monitor_uart.write_line(f"ERR unknown_config:{key}")
-            return
-
-        if line == "GET CONFIG":
-            self.monitor_uart.write_line(f"CONFIG {json.dumps(asdict(self.config))}")
-            return
-
-        if line == "GET STATUS":
-            self.monitor_uart.write_line(f"STATUS {json.dumps(self._status_payload())}")
-            return
-
-        self.monitor_uart.write_line(f"ERR unknown_command:{line}")
+        head, _, args = line.partition(" ")
+        handler = self._MONITOR_HANDLERS.get(head)
+        if handler is None or not handler(self, args):
+            self.monitor_uart.write_line(f"ERR unknown_command:{line}")
 
     def _process_io_uart(self) -> None:
         line = self.io_uart.read_line()
         if not line:
             return
 
-        if line.startswith("SET_SENSOR ") and "=" in line:
-            _, payload = line.split(" ", 1)
-            key, raw_value = payload.split("=", 1)
-            if key == "air_temp_c":
-                self.io.air_temp_c = float(raw_value)
-                self.io_uart.write_line(f"ACK {key}={self.io.air_temp_c}")
-            else:
-                self.io_uart.write_line(f"ERR unknown_sensor:{key}")
-            return
+        head, _, args = line.partition(" ")
+        handler = self._IO_HANDLERS.get(head)
+        if handler is None or not handler(self, args):
+            self.io_uart.write_line(f"ERR unknown_command:{line}")
 
-        if line.startswith("SET_INPUT ") and "=" in line:
-            _, payload = line.split(" ", 1)
-            key, raw_value = payload.split("=", 1)
-            if key in {"door_open", "power_ok"}:
-                setattr(self.io, key, bool(int(raw_value)))
-                self.io_uart.write_line(f"ACK {key}={int(getattr(self.io, key))}")
-            else:
-                self.io_uart.write_line(f"ERR unknown_input:{key}")
-            return
+    # Command handlers receive the text after the command keyword and return
+    # False when the arguments do not form a known command.
 
-        if line == "GET IO":
-            self.io_uart.write_line(f"IO {json.dumps(asdict(self.io))}")
-            return
+    def _handle_monitor_set(self, args: str) -> bool:
+        return self._handle_write(self.monitor_uart, args, self._apply_config_write)
+
+    def _handle_monitor_get(self, args: str) -> bool:
+        if args == "CONFIG":
+            self.monitor_uart.write_line(f"CONFIG {json.dumps(self._config_snapshot())}")
+            return True
+
+        if args == "STATUS":
+            self.monitor_uart.write_line(f"STATUS {json.dumps(self._status_payload())}")
+            return True
+
+        return False
+
+    def _handle_io_set_sensor(self, args: str) -> bool:
+        return self._handle_write(self.io_uart, args, self._apply_sensor_write)
 
-        self.io_uart.write_line(f"ERR unknown_command:{line}")
+    def _handle_io_set_input(self, args: str) -> bool:
+        return self._handle_write(self.io_uart, args, self._apply_input_write)
 
-    def _run_control_logic(self) -> None:
-        now = time.time()
+    def _handle_io_get(self, args: str) -> bool:
+        if args == "IO":
+            self.io_uart.write_line(f"IO {json.dumps(self._io_snapshot())}")
+            return True
+
+        return False
+
+    def _handle_write(
+        self,
+        uart: UARTTransport,
+        args: str,
+        apply: Callable[[str, str], tuple[bool, str]],
+    ) -> bool:
+        key, sep, raw_value = args.partition("=")
+        if not sep:
+            return False
+        ok, message = apply(key, raw_value)
+        uart.write_line(f"ACK {message}" if ok else f"ERR {message}")
+        return True
+
+    # Write helpers apply one key=value update and return (ok, message), where
+    # message is the ACK payload on success or the ERR reason otherwise.
+
+    def _apply_config_write(self, key: str, raw_value: str) -> tuple[bool, str]:
+        converter = self._config_converters.get(key)
+        if converter is None:
+            return False, f"unknown_config:{key}"
+        typed_value = converter(raw_value)
+        setattr(self.config, key, typed_value)
+        return True, f"{key}={typed_value}"
+
+    def _apply_sensor_write(self, key: str, raw_value: str) -> tuple[bool, str]:
+        if key not in _SENSOR_KEYS:
+            return False, f"unknown_sensor:{key}"
+        setattr(self.io, key, float(raw_value))
+        return True, f"{key}={getattr(self.io, key)}"
+
+    def _apply_input_write(self, key: str, raw_value: str) -> tuple[bool, str]:
+        if key not in _INPUT_KEYS:
+            return False, f"unknown_input:{key}"
+        setattr(self.io, key, bool(int(raw_value)))
+        return True, f"{key}={int(getattr(self.io, key))}"
+
+    _MONITOR_HANDLERS: dict[str, Callable[[RefrigerationController, str], bool]] = {
+        "SET": _handle_monitor_set,
+        "GET": _handle_monitor_get,
+    }
+
+    _IO_HANDLERS: dict[str, Callable[[RefrigerationController, str], bool]] = {
+        "SET_SENSOR": _handle_io_set_sensor,
+        "SET_INPUT": _handle_io_set_input,
+        "GET": _handle_io_get,
+    }
+
+    def _run_control_logic(self, now: float) -> None:
         if not self.io.power_ok:
             self._set_compressor(False, now)
             return
@@ -108,23 +172,35 @@ class RefrigerationController:
 
         if self.io.air_temp_c >= upper:
             min_off_elapsed = (now - self.last_compressor_off_s) >= self.config.compressor_min_off_s
-            if min_off_elapsed:
+            if min_off_elapsed and not self.io.compressor_on:
                 self.io.compressor_on = True
         elif self.io.air_temp_c <= lower:
             self._set_compressor(False, now)
 
     def _set_compressor(self, state: bool, now_s: float) -> None:
-        if not state and self.io.compressor_on:
+        if state == self.io.compressor_on:
+            return
+        if not state:
             self.last_compressor_off_s = now_s
         self.io.compressor_on = state
 
+    def _config_snapshot(self) -> dict:
+        return _snapshot(self.config, self._config_fields)
+
+    def _io_snapshot(self) -> dict:
+        return _snapshot(self.io, self._io_fields)
+
     def _status_payload(self) -> dict:
         return {
-            "dimensions_ft": asdict(self.dimensions),
+            "dimensions_ft": _snapshot(self.dimensions, self._dimension_fields),
             "volume_ft3": self.dimensions.volume_ft3,
-            "config": asdict(self.config),
-            "io": asdict(self.io),
+            "config": self._config_snapshot(),
+            "io": self._io_snapshot(),
         }
 
     def _publish_status(self) -> None:
+        token = (self.io.version, self.config.version, self.dimensions.version)
+        if token == self._last_status_token:
+            return
+        self._last_status_token = token
         self.monitor_uart.write_line(f"STATUS {json.dumps(self._status_payload())}")
@@ -1,98 +1,39 @@
-"""PyQt GUI for simulating monitor and IO UART channels."""
+"""PyQt GUI for simulating monitor and IO UART channels.
+
+PyQt6 is imported on first use, so :func:`format_status` stays importable
+(and cheap to import) without it.
+"""
 
 from __future__ import annotations
 
 import json
 import sys
+from typing import TYPE_CHECKING
 
-from PyQt6.QtCore import QTimer
-from PyQt6.QtWidgets import (
-    QApplication,
-    QHBoxLayout,
-    QLabel,
-    QLineEdit,
-    QMainWindow,
-    QPushButton,
-    QTabWidget,
-    QTextEdit,
-    QVBoxLayout,
-    QWidget,
-)
-
-from .controller import RefrigerationController
-from .uart import MockUART
-
-
-class UARTTab(QWidget):
-    def __init__(self, label: str, uart: MockUART) -> None:
-        super().__init__()
-        self.label = label
-        self.uart = uart
-
-        root_layout = QVBoxLayout(self)
-
-        send_layout = QHBoxLayout()
-        self.input_line = QLineEdit()
-        self.input_line.setPlaceholderText(f"Enter {label} command")
-        send_button = QPushButton("Send")
-        send_button.clicked.connect(self.send_message)
-        self.input_line.returnPressed.connect(self.send_message)
-
-        send_layout.addWidget(self.input_line)
-        send_layout.addWidget(send_button)
-
-        root_layout.addLayout(send_layout)
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None
 
-        root_layout.addWidget(QLabel("TX Output"))
-        self.output_log = QTextEdit()
-        self.output_log.setReadOnly(True)
-        root_layout.addWidget(self.output_log)
+if TYPE_CHECKING:
+    from .widgets import UARTTab, UARTWindow
 
-    def send_message(self) -> None:
-        message = self.input_line.text().strip()
-        if not message:
-            return
+_WIDGET_NAMES = frozenset({"UARTTab", "UARTWindow"})
 
-        self.uart.inject_rx(message)
-        self.output_log.append(f"> RX: {message}")
-        self.input_line.clear()
 
-    def append_tx(self, lines: list[str]) -> None:
-        for line in lines:
-            self.output_log.append(f"< TX: {line}")
+def __getattr__(name: str) -> object:
+    if name in _WIDGET_NAMES:
+        from . import widgets
 
+        return getattr(widgets, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-class UARTWindow(QMainWindow):
-    def __init__(self) -> None:
-        super().__init__()
-        self.setWindowTitle("Refrigeration UART Simulator")
-        self.resize(900, 650)
 
-        self.monitor_uart = MockUART()
-        self.io_uart = MockUART()
-        self.controller = RefrigerationController(self.monitor_uart, self.io_uart)
-
-        tabs = QTabWidget()
-        self.monitor_tab = UARTTab("Monitor UART", self.monitor_uart)
-        self.io_tab = UARTTab("IO UART", self.io_uart)
-
-        tabs.addTab(self.monitor_tab, "Monitor UART")
-        tabs.addTab(self.io_tab, "IO UART")
-
-        self.setCentralWidget(tabs)
-
-        self.timer = QTimer(self)
-        self.timer.setInterval(200)
-        self.timer.timeout.connect(self.step_controller)
-        self.timer.start()
-
-    def step_controller(self) -> None:
-        self.controller.step()
-        self.monitor_tab.append_tx(self.monitor_uart.drain_tx())
-        self.io_tab.append_tx(self.io_uart.drain_tx())
+def run_gui() -> int:
+    from PyQt6.QtWidgets import QApplication
 
+    from .widgets import UARTWindow
 
-def run_gui() -> int:
     app = QApplication(sys.argv)
     window = UARTWindow()
     window.show()
@@ -100,5 +41,18 @@ def run_gui() -> int:
 
 
 def format_status(status_payload: dict) -> str:
-    """Utility formatter used by future UI enhancements and tests."""
+    """Utility formatter used by future UI enhancements and tests.
+
+    When orjson is installed it is used first. Its output is equivalent JSON
+    but not byte-identical to ``json.dumps`` (float spelling, escaping and
+    non-finite values can differ). Payloads orjson rejects, such as integers
+    beyond 64 bits, fall back to ``json.dumps``.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                status_payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+            ).decode()
+        except orjson.JSONEncodeError:
+            pass
     return json.dumps(status_payload, indent=2, sort_keys=True)
@@ -6,6 +6,14 @@ from collections import deque
 from dataclasses import dataclass, field
 from typing import Deque, Protocol
 
+# Bounds each mock queue so a stalled reader drops the oldest lines instead of
+# growing without limit.
+MOCK_QUEUE_MAXLEN = 4096
+
+
+def _bounded_queue() -> Deque[str]:
+    return deque(maxlen=MOCK_QUEUE_MAXLEN)
+
 
 class UARTTransport(Protocol):
     def read_line(self) -> str | None:
@@ -15,10 +23,10 @@ class UARTTransport(Protocol):
         ...
 
 
-@dataclass
+@dataclass(slots=True)
 class MockUART:
-    rx_queue: Deque[str] = field(default_factory=deque)
-    tx_queue: Deque[str] = field(default_factory=deque)
+    rx_queue: Deque[str] = field(default_factory=_bounded_queue)
+    tx_queue: Deque[str] = field(default_factory=_bounded_queue)
 
     def inject_rx(self, message: str) -> None:
         self.rx_queue.append(message.strip())
@@ -31,7 +39,9 @@ class MockUART:
     def write_line(self, message: str) -> None:
         self.tx_queue.append(message.strip())
 
-    def drain_tx(self) -> list[str]:
-        output = list(self.tx_queue)
-        self.tx_queue.clear()
+    def drain_tx(self) -> Deque[str]:
+        # Hand the filled queue to the caller and start a fresh one instead of
+        # copying it into a list.
+        output = self.tx_queue
+        self.tx_queue = deque(maxlen=self.tx_queue.maxlen)
         return output
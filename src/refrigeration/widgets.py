@@ -0,0 +1,134 @@
+"""PyQt widgets for the monitor and IO UART simulator.
+
+Imported lazily by :mod:`refrigeration.gui` so PyQt6 is only loaded when the
+GUI is actually started.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Sequence
+
+from PyQt6.QtCore import QTimer
+from PyQt6.QtWidgets import (
+    QHBoxLayout,
+    QLabel,
+    QLineEdit,
+    QMainWindow,
+    QPushButton,
+    QTabWidget,
+    QTextEdit,
+    QVBoxLayout,
+    QWidget,
+)
+
+from .controller import RefrigerationController
+from .uart import MockUART
+
+MAX_LOG_BLOCKS = 2000
+ACTIVE_INTERVAL_MS = 200
+IDLE_INTERVAL_MS = 1000
+IDLE_TICKS_BEFORE_BACKOFF = 2
+
+
+class UARTTab(QWidget):
+    def __init__(
+        self,
+        label: str,
+        uart: MockUART,
+        on_message_sent: Callable[[], None] | None = None,
+    ) -> None:
+        super().__init__()
+        self.label = label
+        self.uart = uart
+        self.on_message_sent = on_message_sent
+
+        root_layout = QVBoxLayout(self)
+
+        send_layout = QHBoxLayout()
+        self.input_line = QLineEdit()
+        self.input_line.setPlaceholderText(f"Enter {label} command")
+        send_button = QPushButton("Send")
+        send_button.clicked.connect(self.send_message)
+        self.input_line.returnPressed.connect(self.send_message)
+
+        send_layout.addWidget(self.input_line)
+        send_layout.addWidget(send_button)
+
+        root_layout.addLayout(send_layout)
+
+        root_layout.addWidget(QLabel("TX Output"))
+        self.output_log = QTextEdit()
+        self.output_log.setReadOnly(True)
+        self.output_log.document().setMaximumBlockCount(MAX_LOG_BLOCKS)
+        root_layout.addWidget(self.output_log)
+
+    def send_message(self) -> None:
+        message = self.input_line.text().strip()
+        if not message:
+            return
+
+        self.uart.inject_rx(message)
+        self.output_log.append(f"> RX: {message}")
+        self.input_line.clear()
+        if self.on_message_sent is not None:
+            self.on_message_sent()
+
+    def append_tx(self, lines: Sequence[str]) -> None:
+        if not lines:
+            return
+        # One append per drain keeps QTextDocument to a single layout pass.
+        self.output_log.append("\n".join(f"< TX: {line}" for line in lines))
+
+
+class UARTWindow(QMainWindow):
+    def __init__(self) -> None:
+        super().__init__()
+        self.setWindowTitle("Refrigeration UART Simulator")
+        self.resize(900, 650)
+
+        self.monitor_uart = MockUART()
+        self.io_uart = MockUART()
+        self.controller = RefrigerationController(self.monitor_uart, self.io_uart)
+
+        tabs = QTabWidget()
+        self.monitor_tab = UARTTab("Monitor UART", self.monitor_uart, self.on_message_sent)
+        self.io_tab = UARTTab("IO UART", self.io_uart, self.on_message_sent)
+
+        tabs.addTab(self.monitor_tab, "Monitor UART")
+        tabs.addTab(self.io_tab, "IO UART")
+
+        self.setCentralWidget(tabs)
+
+        self._idle_ticks = 0
+        self.timer = QTimer(self)
+        self.timer.setInterval(ACTIVE_INTERVAL_MS)
+        self.timer.timeout.connect(self.step_controller)
+        self.timer.start()
+
+    def step_controller(self) -> None:
+        self.controller.step()
+        monitor_lines = self.monitor_uart.drain_tx()
+        io_lines = self.io_uart.drain_tx()
+        self.monitor_tab.append_tx(monitor_lines)
+        self.io_tab.append_tx(io_lines)
+
+        if monitor_lines or io_lines:
+            self.wake()
+            return
+
+        # Back off while the controller has nothing to report; user input wakes it.
+        self._idle_ticks += 1
+        if self._idle_ticks >= IDLE_TICKS_BEFORE_BACKOFF:
+            self.timer.setInterval(IDLE_INTERVAL_MS)
+
+    def on_message_sent(self) -> None:
+        # Handle injected commands right away instead of waiting out the current
+        # (possibly idle) interval, then restart the timer from this step.
+        self.step_controller()
+        self.wake()
+        self.timer.start()
+
+    def wake(self) -> None:
+        self._idle_ticks = 0
+        if self.timer.interval() != ACTIVE_INTERVAL_MS:
+            self.timer.setInterval(ACTIVE_INTERVAL_MS)
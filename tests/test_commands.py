@@ -0,0 +1,38 @@
+from pathlib import Path
+import sys
+import unittest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from refrigeration.controller import RefrigerationController
+from refrigeration.uart import MockUART
+
+
+class ConfigSetTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.monitor = MockUART()
+        self.controller = RefrigerationController(self.monitor, MockUART())
+
+    def test_set_converts_to_field_type(self) -> None:
+        self.monitor.inject_rx("SET target_temp_c=3")
+        self.controller.step()
+        self.monitor.inject_rx("SET compressor_min_off_s=90")
+        self.controller.step()
+
+        self.assertEqual(self.controller.config.target_temp_c, 3.0)
+        self.assertIsInstance(self.controller.config.target_temp_c, float)
+        self.assertEqual(self.controller.config.compressor_min_off_s, 90)
+        self.assertIsInstance(self.controller.config.compressor_min_off_s, int)
+
+        lines = self.monitor.drain_tx()
+        self.assertIn("ACK target_temp_c=3.0", lines)
+        self.assertIn("ACK compressor_min_off_s=90", lines)
+
+    def test_set_unknown_key_reports_error(self) -> None:
+        self.monitor.inject_rx("SET bogus=1")
+        self.controller.step()
+        self.assertIn("ERR unknown_config:bogus", self.monitor.drain_tx())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+from pathlib import Path
+import sys
+import unittest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from refrigeration.config import ControlConfig
+from refrigeration.controller import RefrigerationController
+from refrigeration.uart import MockUART
+
+
+class VersionedTest(unittest.TestCase):
+    def test_every_assignment_bumps_version(self) -> None:
+        config = ControlConfig()
+        start = config.version
+
+        config.target_temp_c = 3.0
+        config.target_temp_c = 3.0
+        self.assertEqual(config.version, start + 2)
+
+    def test_equal_but_distinct_values_bump_version(self) -> None:
+        config = ControlConfig(target_temp_c=0.0)
+        start = config.version
+
+        config.target_temp_c = -0.0
+        self.assertEqual(config.version, start + 1)
+
+
+class StatusPublishTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.monitor = MockUART()
+        self.io = MockUART()
+        self.controller = RefrigerationController(self.monitor, self.io)
+
+    def status_lines(self) -> list[str]:
+        return [line for line in self.monitor.drain_tx() if line.startswith("STATUS ")]
+
+    def test_status_published_once_while_state_is_steady(self) -> None:
+        self.controller.step()
+        self.assertEqual(len(self.status_lines()), 1)
+
+        for _ in range(5):
+            self.controller.step()
+        self.assertEqual(self.status_lines(), [])
+
+    def test_compressor_cycle_does_not_republish_on_steady_ticks(self) -> None:
+        self.controller.last_compressor_off_s -= self.controller.config.compressor_min_off_s
+        self.io.inject_rx("SET_SENSOR air_temp_c=9.0")
+        self.controller.step()
+        self.assertTrue(self.controller.io.compressor_on)
+        self.status_lines()
+
+        for _ in range(3):
+            self.controller.step()
+        self.assertEqual(self.status_lines(), [])
+
+        self.io.inject_rx("SET_SENSOR air_temp_c=0.0")
+        self.controller.step()
+        self.assertFalse(self.controller.io.compressor_on)
+        self.assertEqual(len(self.status_lines()), 1)
+
+        for _ in range(3):
+            self.controller.step()
+        self.assertEqual(self.status_lines(), [])
+
+    def test_negative_zero_write_publishes_status(self) -> None:
+        self.monitor.inject_rx("SET target_temp_c=0.0")
+        self.controller.step()
+        self.status_lines()
+
+        self.monitor.inject_rx("SET target_temp_c=-0.0")
+        self.controller.step()
+        lines = self.status_lines()
+        self.assertEqual(len(lines), 1)
+        self.assertIn('"target_temp_c": -0.0', lines[0])
+
+
+if __name__ == "__main__":
+    unittest.main()